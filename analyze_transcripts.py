@@ -15,9 +15,12 @@ Usage:
     python analyze_transcripts.py cleaned
 """
 
+import os
 import re
 import sys
 import argparse
+import multiprocessing
+from functools import partial
 from pathlib import Path
 from dataclasses import dataclass
 
@@ -46,10 +49,13 @@ class TranscriptData:
 # PARSING FUNCTIONS
 # =============================================================================
 
-def parse_transcript_file(filepath: Path) -> TranscriptData | None:
+def parse_transcript_file(filepath: str | Path, keep_text: bool = True) -> TranscriptData | None:
     """
     Parse a cleaned transcript file and extract metadata and content.
     
+    With keep_text=False the transcript is only counted, and transcript_text
+    is left empty.
+    
     Expected format:
         Title: Video Title Here
         Video ID: abc123xyz
@@ -63,6 +69,7 @@ def parse_transcript_file(filepath: Path) -> TranscriptData | None:
 
         Transcript text here...
     """
+    filepath = Path(filepath)
     try:
         content = filepath.read_text(encoding='utf-8')
         lines = content.split('\n')
@@ -114,7 +121,7 @@ def parse_transcript_file(filepath: Path) -> TranscriptData | None:
             like_count=like_count,
             comment_count=comment_count,
             word_count=word_count,
-            transcript_text=transcript_text
+            transcript_text=transcript_text if keep_text else ""
         )
         
     except Exception as e:
@@ -126,13 +133,18 @@ def collect_transcript_data(folder: Path) -> list[TranscriptData]:
     """Collect data from all transcript files in the folder."""
     data = []
     
-    md_files = list(folder.glob("*.md"))
+    # Plain string paths: cheaper to list and to pickle for the worker pool
+    with os.scandir(folder) as it:
+        md_files = [entry.path for entry in it if entry.is_file() and entry.name.endswith('.md')]
     print(f"Found {len(md_files)} transcript files\n")
     
-    for filepath in md_files:
-        result = parse_transcript_file(filepath)
-        if result and result.view_count > 0:
-            data.append(result)
+    # Files are independent, so parse them across all cores. Only the counts
+    # are used, so workers don't pickle the transcript text back
+    parse = partial(parse_transcript_file, keep_text=False)
+    with multiprocessing.Pool(os.cpu_count()) as pool:
+        for result in pool.imap_unordered(parse, md_files, chunksize=32):
+            if result and result.view_count > 0:
+                data.append(result)
     
     print(f"Successfully parsed {len(data)} files with valid view counts\n")
     return data
@@ -144,25 +156,29 @@ def collect_transcript_data(folder: Path) -> list[TranscriptData]:
 
 def calculate_statistics(data: list[TranscriptData]) -> dict:
     """Calculate various statistics from the transcript data."""
-    view_counts = [d.view_count for d in data]
-    word_counts = [d.word_count for d in data]
+    # Build the arrays once; all reductions below run in C
+    view_counts = np.fromiter((d.view_count for d in data), dtype=np.int64, count=len(data))
+    word_counts = np.fromiter((d.word_count for d in data), dtype=np.int64, count=len(data))
+    
+    q1_views, median_views, q3_views = np.percentile(view_counts, [25, 50, 75])
+    q1_words, median_words, q3_words = np.percentile(word_counts, [25, 50, 75])
     
     stats = {
         'total_videos': len(data),
-        'total_views': sum(view_counts),
-        'average_views': np.mean(view_counts),
-        'median_views': np.median(view_counts),
-        'std_views': np.std(view_counts),
-        'min_views': min(view_counts),
-        'max_views': max(view_counts),
-        'q1_views': np.percentile(view_counts, 25),
-        'q3_views': np.percentile(view_counts, 75),
-        'average_word_count': np.mean(word_counts),
-        'median_word_count': np.median(word_counts),
-        'min_word_count': min(word_counts),
-        'max_word_count': max(word_counts),
-        'q1_word_count': np.percentile(word_counts, 25),
-        'q3_word_count': np.percentile(word_counts, 75),
+        'total_views': int(view_counts.sum()),
+        'average_views': view_counts.mean(),
+        'median_views': median_views,
+        'std_views': view_counts.std(),
+        'min_views': int(view_counts.min()),
+        'max_views': int(view_counts.max()),
+        'q1_views': q1_views,
+        'q3_views': q3_views,
+        'average_word_count': word_counts.mean(),
+        'median_word_count': median_words,
+        'min_word_count': int(word_counts.min()),
+        'max_word_count': int(word_counts.max()),
+        'q1_word_count': q1_words,
+        'q3_word_count': q3_words,
     }
     
     return stats
@@ -204,24 +220,22 @@ def create_like_view_ratio_histogram_norm(data: list[TranscriptData], output_pat
     Shows Q1, median, Q3, and Q4 as dashed lines.
     """
     # Calculate like-to-view ratios (only for videos with views > 0)
-    ratios = []
-    for d in data:
-        if d.view_count > 0:
-            ratio = d.like_count / d.view_count
-            ratios.append(ratio)
+    ratios = np.array([
+        d.like_count / d.view_count
+        for d in data
+        if d.view_count > 0
+    ])
     
-    if not ratios:
+    if ratios.size == 0:
         print("  No valid like-to-view ratios to plot.")
         return None
     
     # Calculate average ratio for normalization
-    avg_ratio = np.mean(ratios)
-    normalized_ratios = [r / avg_ratio if avg_ratio > 0 else 0 for r in ratios]
+    avg_ratio = ratios.mean()
+    normalized_ratios = ratios / avg_ratio if avg_ratio > 0 else np.zeros_like(ratios)
     
-    # Calculate quartiles on normalized data
-    q1_normalized = np.percentile(normalized_ratios, 25)
-    median_normalized = np.percentile(normalized_ratios, 50)
-    q3_normalized = np.percentile(normalized_ratios, 75)
+    # Calculate quartiles on normalized data (single sort for all three)
+    q1_normalized, median_normalized, q3_normalized = np.percentile(normalized_ratios, [25, 50, 75])
     
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 7))
@@ -278,7 +292,7 @@ def create_like_view_ratio_histogram_norm(data: list[TranscriptData], output_pat
     ax.grid(axis='y', alpha=0.3)
     
     # Set x-axis limit to focus on the main distribution
-    max_display = min(max(normalized_ratios), 5.0)
+    max_display = min(normalized_ratios.max(), 5.0)
     ax.set_xlim(0, max_display + 0.5)
     
     # Adjust layout
@@ -301,13 +315,11 @@ def create_word_count_histogram(data: list[TranscriptData], stats: dict, output_
     Shows Q1, median, and Q3 as dashed lines.
     """
     # Get word counts
-    word_counts = [d.word_count for d in data]
+    word_counts = np.fromiter((d.word_count for d in data), dtype=np.int64, count=len(data))
     avg_words = stats['average_word_count']
     
-    # Calculate quartiles on raw data
-    q1 = np.percentile(word_counts, 25)
-    median = np.percentile(word_counts, 50)
-    q3 = np.percentile(word_counts, 75)
+    # Calculate quartiles on raw data (single sort for all three)
+    q1, median, q3 = np.percentile(word_counts, [25, 50, 75])
     
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 7))
@@ -382,21 +394,19 @@ def create_like_view_ratio_histogram_raw(data: list[TranscriptData], output_path
     Shows Q1, median, and Q3 as dashed lines.
     """
     # Calculate like-to-view ratios
-    ratios = [
+    ratios = np.array([
         d.like_count / d.view_count
         for d in data
         if d.view_count > 0
-    ]
+    ])
 
-    if not ratios:
+    if ratios.size == 0:
         print("  No valid like-to-view ratios to plot.")
         return None
 
     # Calculate statistics
-    avg_ratio = np.mean(ratios)
-    q1 = np.percentile(ratios, 25)
-    median = np.percentile(ratios, 50)
-    q3 = np.percentile(ratios, 75)
+    avg_ratio = ratios.mean()
+    q1, median, q3 = np.percentile(ratios, [25, 50, 75])
 
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 7))
@@ -36,19 +36,26 @@ import os
 import re
 import sys
 import time
+import json
 import random
 import argparse
-import itertools
+import threading
 from pathlib import Path
+from operator import attrgetter
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 # Third-party library imports
+import requests
 import scrapetube
+from requests.adapters import HTTPAdapter
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api.proxies import GenericProxyConfig
 from youtube_transcript_api._errors import (
     TranscriptsDisabled,
     NoTranscriptFound,
     VideoUnavailable,
+    RequestBlocked,
 )
 
 try:
@@ -59,14 +66,46 @@ except ImportError:
     print("⚠️  yt-dlp not installed. Video statistics will not be fetched.")
     print("   Install with: pip install yt-dlp")
 
+# Optional: google-re2 gives linear-time matching for the annotation cleanup
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 
 # =============================================================================
 # CONFIGURATION CONSTANTS
 # =============================================================================
 
 DEFAULT_DELAY = 3         # Seconds to wait between processing each video
+DEFAULT_WORKERS = 4       # Videos processed concurrently (requests stay paced by DEFAULT_DELAY)
+MAX_PENDING_VIDEOS = 64   # Videos queued ahead of the workers while listing the channel
 MAX_RETRIES = 5           # How many times to retry if we get rate limited
 INITIAL_RETRY_DELAY = 15  # Seconds to wait after first rate limit error
+PROXY_RETRY_DELAY = 1     # Seconds to wait before retrying through the next proxy
+MAX_BACKOFF = 300         # Upper bound (seconds) on any single retry wait
+MAX_PROXY_FAILURES = 3    # Consecutive failures before a proxy is dropped from rotation
+
+# Transcript languages to try, in order of preference
+DEFAULT_LANGUAGES = ('en', 'en-US', 'en-GB')
+
+# Statuses that won't change on a re-run; these videos are recorded in
+# FAILED_LEDGER and skipped next time
+PERMANENT_FAILURES = {"no_transcript", "transcripts_disabled", "video_unavailable"}
+FAILED_LEDGER = ".failed.json"  # Stored in the output directory
+LEDGER_FLUSH_EVERY = 10         # Save the ledger after this many new entries
+
+# Console messages for the statuses returned by download_transcript()
+STATUS_MESSAGES = {
+    "no_transcript": "No transcript available",
+    "no_manual_transcript": "Only auto-generated (skipped)",
+    "no_transcript_in_language": "No transcript in preferred language",
+    "transcripts_disabled": "Transcripts disabled",
+    "video_unavailable": "Video unavailable",
+    "rate_limited": "Rate limited (try again later)",
+    "max_retries_exceeded": "Max retries exceeded",
+}
 
 # Common YouTube annotations to remove (case-insensitive)
 ANNOTATIONS_TO_REMOVE = [
@@ -98,8 +137,10 @@ ANNOTATIONS_TO_REMOVE = [
 # PROXY MANAGEMENT
 # =============================================================================
 
-_proxy_cycle = None
 _proxy_list = []
+_proxy_rotation = deque()   # Live proxies; the front is handed out next
+_proxy_failures = {}        # proxy -> consecutive failure count
+_proxy_lock = threading.Lock()
 
 
 def load_proxies(proxy_file: str) -> list:
@@ -125,18 +166,51 @@ def load_proxies(proxy_file: str) -> list:
 
 def init_proxy_rotation(proxies: list):
     """Initialize the global proxy rotator."""
-    global _proxy_cycle, _proxy_list
+    global _proxy_list, _proxy_rotation, _proxy_failures
     _proxy_list = proxies
-    if proxies:
-        _proxy_cycle = itertools.cycle(proxies)
+    _proxy_rotation = deque(proxies)
+    _proxy_failures = {proxy: 0 for proxy in proxies}
 
 
 def get_next_proxy() -> str | None:
-    """Get the next proxy in the rotation."""
-    global _proxy_cycle
-    if _proxy_cycle:
-        return next(_proxy_cycle)
-    return None
+    """Get the next proxy in the rotation (None once every proxy was dropped)."""
+    with _proxy_lock:
+        if not _proxy_rotation:
+            return None
+        proxy = _proxy_rotation[0]
+        _proxy_rotation.rotate(-1)
+        return proxy
+
+
+def report_proxy_success(proxy: str):
+    """Reset a proxy's failure streak after a successful request."""
+    with _proxy_lock:
+        _proxy_failures[proxy] = 0
+
+
+def report_proxy_failure(proxy: str):
+    """
+    Record a connection failure through a proxy.
+    
+    After MAX_PROXY_FAILURES failures in a row the proxy is removed from
+    the rotation, so retries stop being spent on dead proxies. Rate limits
+    (429) don't count: they say nothing about whether the proxy works.
+    """
+    with _proxy_lock:
+        _proxy_failures[proxy] = _proxy_failures.get(proxy, 0) + 1
+        if _proxy_failures[proxy] < MAX_PROXY_FAILURES or proxy not in _proxy_rotation:
+            return
+        
+        _proxy_rotation.remove(proxy)
+        remaining = len(_proxy_rotation)
+    
+    # Forget the dropped proxy's client so its pooled connections are released
+    with _transcript_apis_lock:
+        _transcript_apis.pop(proxy, None)
+    
+    print(f"    🚫 Dropping proxy after {MAX_PROXY_FAILURES} failures ({remaining} left): {proxy}")
+    if remaining == 0:
+        print("    ⚠️  No working proxies left, remaining videos will be reported as rate limited")
 
 
 def get_proxy_config(proxy_url: str) -> GenericProxyConfig:
@@ -147,36 +221,166 @@ def get_proxy_config(proxy_url: str) -> GenericProxyConfig:
     )
 
 
+# =============================================================================
+# FAILED VIDEO LEDGER
+# =============================================================================
+
+def load_failed_ledger(output_path: Path) -> dict:
+    """Load the {video_id: status} map of permanently failed videos."""
+    path = output_path / FAILED_LEDGER
+    if not path.exists():
+        return {}
+    
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        print(f"⚠️  Could not read {path}, starting with an empty ledger")
+        return {}
+
+
+def save_failed_ledger(output_path: Path, failed: dict):
+    """Write the failed-video ledger, replacing the old file atomically."""
+    path = output_path / FAILED_LEDGER
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(failed, indent=2, sort_keys=True), encoding='utf-8')
+    os.replace(tmp_path, path)
+
+
+# =============================================================================
+# HTTP SESSIONS
+# =============================================================================
+
+# One API client (and pooled requests.Session) per proxy, shared by all workers
+_transcript_apis = {}
+_transcript_apis_lock = threading.Lock()
+
+
+def get_transcript_api(proxy_url: str | None = None) -> YouTubeTranscriptApi:
+    """
+    Get a YouTubeTranscriptApi that reuses its HTTP connections.
+    
+    Clients are cached per proxy, so consecutive videos skip the TCP/TLS
+    handshake instead of opening a fresh connection for every request.
+    """
+    with _transcript_apis_lock:
+        ytt_api = _transcript_apis.get(proxy_url)
+        if ytt_api is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            
+            proxy_config = get_proxy_config(proxy_url) if proxy_url else None
+            ytt_api = YouTubeTranscriptApi(proxy_config=proxy_config, http_client=session)
+            _transcript_apis[proxy_url] = ytt_api
+        return ytt_api
+
+
+# =============================================================================
+# RATE LIMITING
+# =============================================================================
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter shared by all worker threads.
+    
+    Tokens refill continuously at `rate` per second, up to `capacity`.
+    Each request takes one token; when none is left the caller reserves the
+    next one and sleeps until it is due. Unlike a fixed sleep after every
+    video, time spent on skipped videos or slow responses isn't wasted, while
+    the long-run rate never exceeds `rate`. Keep `capacity` at 1 so workers
+    coming out of a 429 backoff don't find a full bucket and burst.
+    
+    Each request's spacing is moved up to `jitter` seconds either way at
+    random, so requests don't go out at a perfectly regular interval.
+    """
+    
+    def __init__(self, rate: float, capacity: int = 1, jitter: float = 0.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.jitter = jitter
+        self._tokens = 1.0  # Start with one token so the first request isn't delayed
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        # Private generator: jitter is drawn under our own lock instead of
+        # going through the module-level random state shared by all threads
+        self._rng = random.Random()
+    
+    def acquire(self, stop: threading.Event = None) -> bool:
+        """
+        Take a token, blocking until it is due.
+        
+        Returns False if `stop` was set while waiting.
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last_refill = now
+            
+            # Going negative reserves a future token for this caller
+            self._tokens -= 1 + self._rng.uniform(-self.jitter, self.jitter) * self.rate
+            wait_time = -self._tokens / self.rate
+        
+        if stop is None:
+            time.sleep(max(wait_time, 0))
+            return True
+        return not stop.wait(max(wait_time, 0))
+
+
+def backoff_delay(attempt: int, base: float) -> float:
+    """
+    Truncated exponential backoff with jitter.
+    
+    Doubles `base` for every failed attempt, adds up to `base` seconds of
+    random jitter so parallel workers don't retry in lockstep, and caps
+    the result at MAX_BACKOFF.
+    """
+    return min(base * (2 ** attempt) + random.uniform(0, base), MAX_BACKOFF)
+
+
 # =============================================================================
 # HELPER FUNCTIONS
 # =============================================================================
 
+# Built once at import; these run for every video in the channel
+_BAD_FN_TABLE = str.maketrans('', '', '<>:"/\\|?*')
+_WS = re.compile(r'\s+')
+
+# One pass over the URL; the named group that matched is the identifier type
+_RE_CHANNEL_URL = re.compile(
+    r'youtube\.com/(?:@(?P<username>[\w-]+)'
+    r'|channel/(?P<channel_id>UC[\w-]+)'
+    r'|c/(?P<custom>[\w-]+)'
+    r'|user/(?P<user>[\w-]+))'
+)
+
+
 def sanitize_filename(title: str) -> str:
     """Remove characters that aren't allowed in filenames."""
-    sanitized = re.sub(r'[<>:"/\\|?*]', '', title)
-    sanitized = re.sub(r'\s+', ' ', sanitized)
+    sanitized = title.translate(_BAD_FN_TABLE)
+    sanitized = _WS.sub(' ', sanitized)
     return sanitized[:100].strip()
 
 
+def get_video_title(video: dict, video_id: str) -> str:
+    """Get a video's title from a scrapetube entry, falling back to its ID."""
+    try:
+        return video['title']['runs'][0]['text']
+    except (KeyError, IndexError, TypeError):
+        return video_id
+
+
 def extract_channel_identifier(url: str) -> tuple[str, str]:
     """Parse a YouTube channel URL and extract the channel identifier."""
     url = url.strip()
     
-    if match := re.search(r'youtube\.com/@([\w-]+)', url):
-        return ('username', match.group(1))
-    
-    if match := re.search(r'youtube\.com/channel/(UC[\w-]+)', url):
-        return ('channel_id', match.group(1))
-    
-    if match := re.search(r'youtube\.com/c/([\w-]+)', url):
-        return ('custom', match.group(1))
-    
-    if match := re.search(r'youtube\.com/user/([\w-]+)', url):
-        return ('user', match.group(1))
-    
     if url.startswith('@'):
         return ('username', url[1:])
     
+    if match := _RE_CHANNEL_URL.search(url):
+        return (match.lastgroup, match.group(match.lastgroup))
+    
     raise ValueError(
         f"Could not parse channel URL: {url}\n"
         "Supported formats:\n"
@@ -190,8 +394,6 @@ def extract_channel_identifier(url: str) -> tuple[str, str]:
 
 def get_channel_videos(channel_url: str, limit: int = None):
     """Get a list of all videos from a YouTube channel."""
-    import json
-    
     id_type, identifier = extract_channel_identifier(channel_url)
     
     print(f"📺 Fetching videos from channel: {identifier}")
@@ -223,6 +425,17 @@ def get_channel_videos(channel_url: str, limit: int = None):
 # TEXT CLEANING FUNCTIONS
 # =============================================================================
 
+# Known annotations plus any other bracketed text, stripped in a single pass.
+# The pattern is plain literals and character classes, so RE2's DFA engine can
+# run it when installed; the inline (?i) flag works for both engines.
+_ANNOTATIONS_RE = (re2 if RE2_AVAILABLE else re).compile(
+    '(?i)(?:' + '|'.join(ANNOTATIONS_TO_REMOVE) + r')|\[[^\]]*\]'
+)
+_SPACES_RE = re.compile(r'[\r\n ]+')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([.,!?;:])')
+_NO_SPACE_AFTER_PUNCT_RE = re.compile(r'([.,!?;:])([A-Za-z])')
+
+
 def clean_transcript_text(text: str) -> str:
     """
     Clean transcript text by removing annotations and fixing formatting.
@@ -230,24 +443,17 @@ def clean_transcript_text(text: str) -> str:
     """
     cleaned = text
     
-    # Remove YouTube annotations (case-insensitive)
-    for annotation in ANNOTATIONS_TO_REMOVE:
-        cleaned = re.sub(annotation, '', cleaned, flags=re.IGNORECASE)
-    
-    # Remove any other bracketed annotations
-    cleaned = re.sub(r'\[[^\]]*\]', '', cleaned)
-    
-    # Replace all newlines and carriage returns with spaces
-    cleaned = re.sub(r'[\r\n]+', ' ', cleaned)
+    # Remove YouTube annotations (case-insensitive) and any other bracketed text
+    cleaned = _ANNOTATIONS_RE.sub('', cleaned)
     
-    # Fix multiple spaces
-    cleaned = re.sub(r'  +', ' ', cleaned)
+    # Replace newlines and runs of spaces with a single space
+    cleaned = _SPACES_RE.sub(' ', cleaned)
     
     # Remove spaces before punctuation
-    cleaned = re.sub(r'\s+([.,!?;:])', r'\1', cleaned)
+    cleaned = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', cleaned)
     
     # Ensure space after punctuation (if followed by letter)
-    cleaned = re.sub(r'([.,!?;:])([A-Za-z])', r'\1 \2', cleaned)
+    cleaned = _NO_SPACE_AFTER_PUNCT_RE.sub(r'\1 \2', cleaned)
     
     # Remove leading/trailing whitespace
     cleaned = cleaned.strip()
@@ -259,6 +465,34 @@ def clean_transcript_text(text: str) -> str:
 # VIDEO STATISTICS FUNCTIONS
 # =============================================================================
 
+# Only the watch page metadata is needed: skip the player JS and the
+# DASH/HLS manifests that yt-dlp would otherwise fetch to build formats
+YDL_OPTIONS = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+    'skip_download': True,
+    'extractor_args': {
+        'youtube': {
+            'player_skip': ['js'],
+            'skip': ['dash', 'hls'],
+        },
+    },
+}
+
+# YoutubeDL isn't thread-safe, so each worker thread keeps its own instance
+_ydl_local = threading.local()
+
+
+def get_youtube_dl() -> "yt_dlp.YoutubeDL":
+    """Get this thread's YoutubeDL, creating it on first use."""
+    ydl = getattr(_ydl_local, 'ydl', None)
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(YDL_OPTIONS)
+        _ydl_local.ydl = ydl
+    return ydl
+
+
 def get_video_statistics(video_id: str) -> dict | None:
     """
     Fetch statistics for a video using yt-dlp.
@@ -271,23 +505,16 @@ def get_video_statistics(video_id: str) -> dict | None:
     
     url = f"https://www.youtube.com/watch?v={video_id}"
     
-    ydl_opts = {
-        'quiet': True,
-        'no_warnings': True,
-        'extract_flat': False,
-        'skip_download': True,
-    }
-    
     try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            
-            return {
-                'view_count': info.get('view_count', 0) or 0,
-                'like_count': info.get('like_count', 0) or 0,
-                'favorite_count': 0,  # YouTube doesn't expose this anymore
-                'comment_count': info.get('comment_count', 0) or 0,
-            }
+        # process=False skips format sorting/selection; counts are already present
+        info = get_youtube_dl().extract_info(url, download=False, process=False)
+        
+        return {
+            'view_count': info.get('view_count', 0) or 0,
+            'like_count': info.get('like_count', 0) or 0,
+            'favorite_count': 0,  # YouTube doesn't expose this anymore
+            'comment_count': info.get('comment_count', 0) or 0,
+        }
     except Exception:
         return None
 
@@ -313,80 +540,92 @@ def format_output_file(title: str, video_id: str, transcript: str, stats: dict |
 
         Cleaned transcript text here...
     """
-    output = []
-    
-    # Add metadata section
-    output.append(f"Title: {title}")
-    output.append(f"Video ID: {video_id}")
-    output.append(f"URL: https://www.youtube.com/watch?v={video_id}")
-    
     # Add video stats if available
+    stats_block = ""
     if stats:
-        output.append(f"View Count: {stats['view_count']}")
-        output.append(f"Like Count: {stats['like_count']}")
-        output.append(f"Favorite Count: {stats['favorite_count']}")
-        output.append(f"Comment Count: {stats['comment_count']}")
-    
-    # Add separator
-    output.append('')
-    output.append('=' * 40)
-    output.append('')
-    
-    # Add cleaned transcript
-    cleaned_transcript = clean_transcript_text(transcript)
-    output.append(cleaned_transcript)
+        stats_block = (
+            f"View Count: {stats['view_count']}\n"
+            f"Like Count: {stats['like_count']}\n"
+            f"Favorite Count: {stats['favorite_count']}\n"
+            f"Comment Count: {stats['comment_count']}\n"
+        )
     
-    return '\n'.join(output)
+    # Metadata, separator and cleaned transcript in a single string build
+    return (
+        f"Title: {title}\n"
+        f"Video ID: {video_id}\n"
+        f"URL: https://www.youtube.com/watch?v={video_id}\n"
+        f"{stats_block}"
+        f"\n{'=' * 40}\n\n"
+        f"{clean_transcript_text(transcript)}"
+    )
 
 
 # =============================================================================
 # CORE TRANSCRIPT DOWNLOAD FUNCTION
 # =============================================================================
 
+# requests' HTTPError text for 5xx responses, e.g. "503 Server Error: Service Unavailable".
+# Matching the reason too keeps video IDs like "ab-503-cdefg" out.
+_SERVER_ERROR_RE = re.compile(r'\b5\d\d Server Error\b')
+
+
 def download_transcript(
     video_id: str, 
     languages: list = None, 
     retries: int = MAX_RETRIES, 
     manual_only: bool = False,
-    use_proxies: bool = False
+    use_proxies: bool = False,
+    stop: threading.Event = None
 ) -> tuple[str | None, str]:
     """
     Download the transcript for a single YouTube video.
     
+    Setting `stop` interrupts a retry backoff; the status is then "cancelled".
+    
     Returns:
         A tuple of (transcript_text, status)
     """
     if languages is None:
-        languages = ['en', 'en-US', 'en-GB']
+        languages = DEFAULT_LANGUAGES
+    if stop is None:
+        stop = threading.Event()  # Never set: the backoff waits are plain sleeps
+    
+    # Set once the transcript list has been fetched, so a retry after a
+    # failed fetch() doesn't list the video's transcripts again
+    transcript = None
     
     for attempt in range(retries):
         try:
             current_proxy = None
-            proxy_config = None
             if use_proxies:
                 current_proxy = get_next_proxy()
-                if current_proxy:
-                    proxy_config = get_proxy_config(current_proxy)
-            
-            ytt_api = YouTubeTranscriptApi(proxy_config=proxy_config)
-            transcript_list = ytt_api.list(video_id)
-            
-            transcript = None
+                # Never fall back to the user's own IP once every proxy is gone
+                if current_proxy is None:
+                    return None, "rate_limited"
             
-            try:
-                transcript = transcript_list.find_manually_created_transcript(languages)
-            except NoTranscriptFound:
-                if manual_only:
-                    return None, "no_manual_transcript"
+            # A transcript is tied to the session that listed it, so when
+            # rotating proxies it has to be looked up again through the new one
+            if transcript is None or use_proxies:
+                ytt_api = get_transcript_api(current_proxy)
+                transcript_list = ytt_api.list(video_id)
                 
                 try:
-                    transcript = transcript_list.find_generated_transcript(languages)
+                    transcript = transcript_list.find_manually_created_transcript(languages)
                 except NoTranscriptFound:
-                    return None, "no_transcript_in_language"
+                    if manual_only:
+                        return None, "no_manual_transcript"
+                    
+                    try:
+                        transcript = transcript_list.find_generated_transcript(languages)
+                    except NoTranscriptFound:
+                        return None, "no_transcript_in_language"
             
             if transcript:
                 transcript_data = transcript.fetch()
-                full_text = ' '.join([snippet.text for snippet in transcript_data])
+                full_text = ' '.join(map(attrgetter('text'), transcript_data))
+                if current_proxy:
+                    report_proxy_success(current_proxy)
                 return full_text, "success"
             
             return None, "no_transcript"
@@ -400,27 +639,48 @@ def download_transcript(
         except VideoUnavailable:
             return None, "video_unavailable"
         
+        except RequestBlocked as e:
+            # YouTube answered 429 or blocked the IP (IpBlocked is a subclass);
+            # the message mentions neither, so the exception type is the signal
+            error_msg = str(e)
+            is_rate_limited = True
+        
         except Exception as e:
             error_msg = str(e)
-            
             is_rate_limited = "429" in error_msg or "Too Many Requests" in error_msg
-            is_proxy_error = "proxy" in error_msg.lower() or "connect" in error_msg.lower()
-            
-            if is_rate_limited or is_proxy_error:
-                if attempt < retries - 1:
-                    if use_proxies and current_proxy:
-                        error_type = "Rate limited" if is_rate_limited else "Proxy failed"
-                        print(f"    🔄 {error_type}. Trying next proxy (retry {attempt + 2}/{retries})...")
-                        time.sleep(1)
-                    else:
-                        wait_time = INITIAL_RETRY_DELAY * (2 ** attempt) + random.uniform(1, 10)
-                        print(f"    ⏳ Rate limited. Waiting {wait_time:.0f}s (retry {attempt + 2}/{retries})...")
-                        time.sleep(wait_time)
-                    continue
-                else:
-                    return None, "rate_limited"
-            
+        
+        # A RequestBlocked raised through a proxy mentions the proxy config,
+        # but it is a rate limit, not a dead proxy
+        is_proxy_error = not is_rate_limited and (
+            "proxy" in error_msg.lower() or "connect" in error_msg.lower()
+        )
+        is_server_error = bool(_SERVER_ERROR_RE.search(error_msg))
+        
+        if current_proxy and is_proxy_error:
+            report_proxy_failure(current_proxy)
+        
+        # Anything else (other 4xx, parsing errors, ...) won't get better on retry
+        if not (is_rate_limited or is_proxy_error or is_server_error):
             return None, f"error: {error_msg[:80]}"
+        
+        if attempt == retries - 1:
+            return None, "rate_limited" if (is_rate_limited or is_proxy_error) else "max_retries_exceeded"
+        
+        if is_rate_limited:
+            error_type = "Rate limited"
+        elif is_proxy_error:
+            error_type = "Proxy failed"
+        else:
+            error_type = "Server error"
+        
+        if use_proxies and current_proxy:
+            wait_time = backoff_delay(attempt, PROXY_RETRY_DELAY)
+            print(f"    🔄 {error_type}. Trying next proxy in {wait_time:.0f}s (retry {attempt + 2}/{retries})...")
+        else:
+            wait_time = backoff_delay(attempt, INITIAL_RETRY_DELAY)
+            print(f"    ⏳ {error_type}. Waiting {wait_time:.0f}s (retry {attempt + 2}/{retries})...")
+        if stop.wait(wait_time):
+            return None, "cancelled"
     
     return None, "max_retries_exceeded"
 
@@ -429,6 +689,84 @@ def download_transcript(
 # MAIN PROCESSING FUNCTION
 # =============================================================================
 
+def process_video(
+    progress: str,
+    video: dict,
+    output_prefix: str,
+    existing: set,
+    languages: list,
+    use_proxies: bool,
+    skip_stats: bool,
+    limiter: TokenBucket,
+    stop: threading.Event
+) -> str:
+    """
+    Download, format and save the transcript for a single video.
+    
+    Runs on a worker thread. Output files are named per video, so workers
+    never write to the same path and no locking is needed.
+    
+    Returns:
+        "success", "skipped", "cancelled", or the failure status
+        from download_transcript()
+    """
+    if stop.is_set():
+        return "cancelled"
+    
+    video_id = video['videoId']
+    title = get_video_title(video, video_id)
+    
+    safe_title = sanitize_filename(title)
+    filename = f"{safe_title}_{video_id}.md"
+    
+    # Skip if already downloaded
+    safe_name = title.encode('ascii', errors='replace').decode('ascii')[:50]
+    if filename in existing:
+        print(f"[{progress}] ⏭️  Skipping (exists): {safe_name}...")
+        return "skipped"
+    
+    # Wait for our turn before hitting YouTube
+    if not limiter.acquire(stop):
+        return "cancelled"
+    
+    # Show progress (with safe filename for console)
+    print(f"[{progress}] 📄 Processing: {safe_name}...")
+    
+    # Download transcript
+    transcript, status = download_transcript(
+        video_id, 
+        languages, 
+        use_proxies=use_proxies,
+        stop=stop
+    )
+    
+    if transcript:
+        # Fetch video statistics (unless disabled)
+        stats = None
+        if not skip_stats and YT_DLP_AVAILABLE:
+            stats = get_video_statistics(video_id)
+        
+        # Format and save the output
+        output_content = format_output_file(title, video_id, transcript, stats)
+        
+        with open(output_prefix + filename, 'w', encoding='utf-8') as f:
+            f.write(output_content)
+        existing.add(filename)  # set.add is atomic, no lock needed
+        
+        stats_info = ""
+        if stats:
+            stats_info = f" (Views: {stats['view_count']:,})"
+        print(f"[{progress}]     ✅ Saved: {filename[:60]}...{stats_info}")
+        return "success"
+    
+    if status == "cancelled":
+        return status
+    
+    msg = STATUS_MESSAGES.get(status, status)
+    print(f"[{progress}]     ❌ {msg}")
+    return status
+
+
 def download_all_transcripts(
     channel_url: str,
     output_dir: str = "transcripts",
@@ -436,14 +774,15 @@ def download_all_transcripts(
     languages: list = None,
     delay: float = DEFAULT_DELAY,
     proxy_file: str = None,
-    skip_stats: bool = False
+    skip_stats: bool = False,
+    workers: int = DEFAULT_WORKERS
 ):
     """
     Download transcripts for all videos on a YouTube channel.
     
     This function:
     1. Gets the list of videos from the channel
-    2. Downloads each transcript
+    2. Downloads each transcript (several videos at a time)
     3. Fetches video statistics (views, likes, comments)
     4. Cleans and formats the output
     5. Saves as clean formatted files
@@ -452,6 +791,10 @@ def download_all_transcripts(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
+    # Resolved once; workers build file paths by plain string concatenation
+    output_abs = output_path.absolute()
+    output_prefix = str(output_abs) + os.sep
+    
     # Load proxies if provided
     use_proxies = False
     if proxy_file:
@@ -461,8 +804,9 @@ def download_all_transcripts(
             use_proxies = True
     
     # Print initial status
-    print(f"📁 Saving transcripts to: {output_path.absolute()}")
+    print(f"📁 Saving transcripts to: {output_abs}")
     print(f"⏱️  Delay between requests: {delay}s")
+    print(f"🧵 Workers: {workers}")
     if use_proxies:
         print(f"🔄 Proxy rotation enabled ({len(_proxy_list)} proxies)")
     if skip_stats:
@@ -471,100 +815,124 @@ def download_all_transcripts(
         print("📊 Video statistics disabled (yt-dlp not installed)")
     print()
     
-    # Get the list of videos
+    # Stream videos straight from the channel listing into the worker pool,
+    # so downloads start while scrapetube is still paging through the channel
     videos = get_channel_videos(channel_url, limit)
-    video_list = list(videos)
-    total_videos = len(video_list)
-    print(f"📊 Found {total_videos} videos to process\n")
     
-    if total_videos == 0:
-        print("❌ No videos found. Check the channel URL.")
-        return
+    # One directory read up front instead of a stat() per video
+    existing = {name for name in os.listdir(output_path) if name.endswith('.md')}
     
-    # Initialize counters
-    success_count = 0
-    fail_count = 0
-    skipped_count = 0
-    rate_limit_count = 0
+    # Videos that had no transcript on an earlier run
+    failed = load_failed_ledger(output_path)
+    unsaved_failures = 0
     
-    # Process each video
-    for idx, video in enumerate(video_list, 1):
-        video_id = video['videoId']
-        title = video.get('title', {}).get('runs', [{}])[0].get('text', video_id)
-        
-        safe_title = sanitize_filename(title)
-        filename = f"{safe_title}_{video_id}.md"
-        filepath = output_path / filename
-        
-        # Skip if already downloaded
-        if filepath.exists():
-            safe_name = title.encode('ascii', errors='replace').decode('ascii')[:50]
-            print(f"[{idx}/{total_videos}] ⏭️  Skipping (exists): {safe_name}...")
-            skipped_count += 1
-            continue
+    # Tally of process_video() statuses
+    results = Counter()
+    total_videos = 0
+    
+    # Requests overlap across workers; the bucket keeps them paced as a whole.
+    # Spacing is delay + uniform(1, 3) seconds, as with the old fixed sleeps.
+    limiter = TokenBucket(rate=1 / (delay + 2), jitter=1)
+    stop = threading.Event()
+    pending = set()
+    pending_ids = {}
+    
+    def collect(timeout=None):
+        """
+        Record the results of finished videos.
         
-        # Show progress (with safe filename for console)
-        safe_name = title.encode('ascii', errors='replace').decode('ascii')[:50]
-        print(f"[{idx}/{total_videos}] 📄 Processing: {safe_name}...")
+        Blocks until at least one video finishes, or for at most `timeout`
+        seconds (0 just picks up whatever is already done).
+        """
+        nonlocal pending, unsaved_failures
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            video_id = pending_ids.pop(future)
+            if future.cancelled():
+                continue
+            
+            status = future.result()
+            results[status] += 1
+            if status in PERMANENT_FAILURES:
+                failed[video_id] = status
+                unsaved_failures += 1
         
-        # Download transcript
-        transcript, status = download_transcript(
-            video_id, 
-            languages, 
-            use_proxies=use_proxies
-        )
+        if unsaved_failures >= LEDGER_FLUSH_EVERY:
+            save_failed_ledger(output_path, failed)
+            unsaved_failures = 0
         
-        if transcript:
-            # Fetch video statistics (unless disabled)
-            stats = None
-            if not skip_stats and YT_DLP_AVAILABLE:
-                stats = get_video_statistics(video_id)
-            
-            # Format and save the output
-            output_content = format_output_file(title, video_id, transcript, stats)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(output_content)
-            
-            stats_info = ""
-            if stats:
-                stats_info = f" (Views: {stats['view_count']:,})"
-            print(f"    ✅ Saved: {filename[:60]}...{stats_info}")
-            success_count += 1
-        else:
-            status_messages = {
-                "no_transcript": "No transcript available",
-                "no_manual_transcript": "Only auto-generated (skipped)",
-                "no_transcript_in_language": "No transcript in preferred language",
-                "transcripts_disabled": "Transcripts disabled",
-                "video_unavailable": "Video unavailable",
-                "rate_limited": "Rate limited (try again later)",
-                "max_retries_exceeded": "Max retries exceeded",
-            }
-            msg = status_messages.get(status, status)
-            print(f"    ❌ {msg}")
-            fail_count += 1
-            
-            if status == "rate_limited":
-                rate_limit_count += 1
-                if rate_limit_count >= 3:
-                    print("\n⚠️  Too many rate limits. Consider:")
-                    print("   1. Wait 1-2 hours before trying again")
-                    print("   2. Use a VPN to change your IP address")
+        if results["rate_limited"] >= 3 and not stop.is_set():
+            print("\n⚠️  Too many rate limits. Consider:")
+            print("   1. Wait 1-2 hours before trying again")
+            print("   2. Use a VPN to change your IP address")
+            stop.set()
+            for future in pending:
+                future.cancel()
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        try:
+            for idx, video in enumerate(videos, 1):
+                # Bounded queue: don't run ahead of the workers. Otherwise just
+                # pick up finished videos so the rate-limit guard runs early.
+                if len(pending) >= MAX_PENDING_VIDEOS:
+                    collect()
+                else:
+                    collect(timeout=0)
+                if stop.is_set():
                     break
-        
-        # Wait before next video
-        if idx < total_videos:
-            actual_delay = delay + random.uniform(1, 3)
-            time.sleep(actual_delay)
+                total_videos = idx
+                
+                # The channel size isn't known while streaming, but --limit caps it
+                progress = f"{idx}/{limit}" if limit else str(idx)
+                
+                # Known permanent failure from a previous run: don't ask again
+                video_id = video['videoId']
+                if video_id in failed:
+                    msg = STATUS_MESSAGES.get(failed[video_id], failed[video_id])
+                    print(f"[{progress}] ⏭️  Skipping (previously failed: {msg}): {video_id}")
+                    results["known_failure"] += 1
+                    continue
+                
+                future = executor.submit(
+                    process_video, progress, video, output_prefix, existing,
+                    languages, use_proxies, skip_stats, limiter, stop
+                )
+                pending.add(future)
+                pending_ids[future] = video_id
+            
+            # One completion at a time, so too many rate limits stops the run
+            while pending:
+                collect()
+        except BaseException:
+            # Ctrl+C or a worker error: don't let the executor drain the
+            # remaining queue before the exception surfaces
+            stop.set()
+            for future in pending:
+                future.cancel()
+            raise
+        finally:
+            if unsaved_failures:
+                save_failed_ledger(output_path, failed)
+    
+    if total_videos == 0:
+        print("❌ No videos found. Check the channel URL.")
+        return
+    
+    success_count = results["success"]
+    skipped_count = results["skipped"]
+    known_failure_count = results["known_failure"]
+    fail_count = (sum(results.values()) - success_count - skipped_count
+                  - known_failure_count - results["cancelled"])
     
     # Print final summary
     print(f"\n{'='*50}")
     print(f"✨ Done! Results:")
+    print(f"    📊 Videos found: {total_videos}")
     print(f"    ✅ Downloaded: {success_count}")
     print(f"    ⏭️  Skipped (existing): {skipped_count}")
+    print(f"    ⏭️  Skipped (failed before): {known_failure_count}")
     print(f"    ❌ Failed: {fail_count}")
-    print(f"📁 Files saved to: {output_path.absolute()}")
+    print(f"📁 Files saved to: {output_abs}")
 
 
 # =============================================================================
@@ -583,6 +951,7 @@ Examples:
   python download_transcripts.py @ChannelName -o my_transcripts
   python download_transcripts.py @ChannelName --limit 10 --delay 5
   python download_transcripts.py @ChannelName --skip-stats
+  python download_transcripts.py @ChannelName --workers 8
 
 Output format:
   Title: Video Title
@@ -620,7 +989,7 @@ Output format:
     parser.add_argument(
         "--languages",
         nargs="+",
-        default=['en', 'en-US', 'en-GB'],
+        default=list(DEFAULT_LANGUAGES),
         help="Preferred transcript languages (default: en en-US en-GB)"
     )
     
@@ -644,6 +1013,13 @@ Output format:
         help="Skip fetching video statistics (faster, but no view/like counts)"
     )
     
+    parser.add_argument(
+        "-w", "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of videos to process concurrently (default: {DEFAULT_WORKERS})"
+    )
+    
     args = parser.parse_args()
     
     try:
@@ -654,7 +1030,8 @@ Output format:
             languages=args.languages,
             delay=args.delay,
             proxy_file=args.proxies,
-            skip_stats=args.skip_stats
+            skip_stats=args.skip_stats,
+            workers=args.workers
         )
     except ValueError as e:
         print(f"❌ Error: {e}")
@@ -1,8 +1,10 @@
 import os
 import re
 import csv
+import mmap
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 
 def count_words_after_separator(file_path):
     """
@@ -10,28 +12,45 @@ def count_words_after_separator(file_path):
     Returns 0 if separator not found or file cannot be read.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         # Find the separator (40 equal signs)
-        separator = '=' * 40
-        
-        # Split by separator and take content after it
-        parts = content.split(separator)
-        if len(parts) < 2:
-            return 0  # No separator found
+        separator = b'=' * 40
         
-        # Get content after the separator
-        content_after = parts[1]
-        
-        # Count words (split by whitespace)
-        words = content_after.split()
-        return len(words)
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return 0  # Empty files can't be mapped
+            
+            # Map the file and search the raw bytes; nothing is decoded
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                index = mm.find(separator)
+                if index < 0:
+                    return 0  # No separator found
+                
+                # Count whitespace-separated words after the separator
+                return len(mm[index + len(separator):].split())
     
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return 0
 
+def find_markdown_files(root):
+    """
+    Yield the paths (as strings) of all markdown files under root.
+    Walks the tree with os.scandir and an explicit stack, avoiding the
+    Path objects and pattern matching that Path.rglob does per entry.
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue  # Unreadable directory: skip it, as rglob did
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.md') and entry.is_file():
+                    yield entry.path
+
 def calculate_reading_time(word_count, words_per_minute=250):
     """Calculate reading time in minutes."""
     return word_count / words_per_minute
@@ -56,6 +75,7 @@ def categorize_by_reading_time(folders):
     
     files_by_category = defaultdict(list)
     
+    md_files = []
     for folder in folders:
         folder_path = Path(folder)
         
@@ -64,11 +84,13 @@ def categorize_by_reading_time(folders):
             continue
         
         # Find all markdown files recursively
-        md_files = list(folder_path.rglob('*.md'))
+        md_files.extend(find_markdown_files(folder))
+    
+    # Files are independent, so count words across all cores
+    with ProcessPoolExecutor() as executor:
+        word_counts = executor.map(count_words_after_separator, md_files, chunksize=64)
         
-        for md_file in md_files:
-            word_count = count_words_after_separator(md_file)
-            
+        for md_file, word_count in zip(md_files, word_counts):
             if word_count == 0:
                 continue  # Skip files with no content after separator
             
@@ -93,6 +115,14 @@ def categorize_by_reading_time(folders):
     
     return categories, files_by_category
 
+def get_relative_path(file_path, base_path):
+    """Return file_path relative to base_path, or just the file name if it's outside."""
+    file_path = Path(file_path)
+    try:
+        return str(file_path.relative_to(base_path))
+    except ValueError:
+        return file_path.name
+
 def save_to_csv(files_by_category, base_path, output_file='reading_time_analysis.csv'):
     """Save detailed file information to CSV with relative paths."""
     base_path = Path(base_path)
@@ -109,22 +139,19 @@ def save_to_csv(files_by_category, base_path, output_file='reading_time_analysis
             'more_than_15': 'More than 15 minutes'
         }
         
-        for category in ['less_than_2', '2_to_5', '5_to_10', '10_to_15', 'more_than_15']:
-            for file_path, reading_time, word_count in files_by_category[category]:
-                try:
-                    # Get relative path from base path
-                    relative_path = file_path.relative_to(base_path)
-                except ValueError:
-                    # If file is not relative to base_path, just use the name
-                    relative_path = file_path.name
-                
-                writer.writerow([
-                    file_path.name,
-                    str(relative_path),
-                    word_count,
-                    f"{reading_time:.2f}",
-                    category_labels[category]
-                ])
+        # Hand every row to the C writer in one call
+        rows = (
+            [
+                os.path.basename(file_path),
+                get_relative_path(file_path, base_path),
+                word_count,
+                f"{reading_time:.2f}",
+                category_labels[category]
+            ]
+            for category in ['less_than_2', '2_to_5', '5_to_10', '10_to_15', 'more_than_15']
+            for file_path, reading_time, word_count in files_by_category[category]
+        )
+        writer.writerows(rows)
 
 def main():
     # Define the base path (parent of all folders to analyze)